@@ -1,15 +1,103 @@
+import re
+from collections import Counter, deque
+from typing import Iterable
 from .base_agent import BaseAgent
 
+# Severity keyword found in a typical log line
+LEVEL_PATTERN = re.compile(r"\b(CRITICAL|FATAL|ERROR|WARN(?:ING)?|INFO|DEBUG|TRACE)\b", re.IGNORECASE)
+# Numbers, hex ids and quoted values that vary between otherwise identical messages
+VARIABLE_PATTERN = re.compile(r"0x[0-9a-fA-F]+|\d+(?:\.\d+)*|'[^']*'|\"[^\"]*\"")
+# Logs up to this size are sent verbatim; larger ones are summarized
+RAW_LOG_MAX_BYTES = 256 * 1024
+
+
+class LogDigest:
+    """Rolling summary of a log stream, built one chunk at a time.
+
+    Only counters, a bounded set of message patterns and the last lines of
+    the log are kept, so memory stays flat however large the file is. Lines
+    longer than ``max_line_bytes`` (e.g. minified JSON) are truncated.
+    """
+
+    def __init__(self, tail_lines: int = 200, max_patterns: int = 10000, max_line_bytes: int = 4096):
+        self.total_lines = 0
+        self.levels = Counter()
+        self.patterns = Counter()
+        self.samples = {}
+        self.tail = deque(maxlen=tail_lines)
+        self.max_patterns = max_patterns
+        self.max_line_bytes = max_line_bytes
+        self._partial = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of raw log bytes."""
+        lines = chunk.split(b"\n")
+        # The last piece may be a line cut in half by the chunk boundary;
+        # only its head is kept so a line without newlines can't grow forever
+        tail = lines.pop()
+        if lines:
+            self._add_line(self._extend_partial(lines[0]))
+            self._partial = b""
+            for line in lines[1:]:
+                self._add_line(line)
+        self._partial = self._extend_partial(tail)
+
+    def _extend_partial(self, piece: bytes) -> bytes:
+        """Return the pending line with ``piece`` appended, up to ``max_line_bytes``."""
+        room = self.max_line_bytes - len(self._partial)
+        return self._partial + piece[:room] if room > 0 else self._partial
+
+    def close(self) -> None:
+        """Flush a trailing line that had no newline."""
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = b""
+
+    def _add_line(self, raw: bytes) -> None:
+        line = raw[:self.max_line_bytes].decode("utf-8", errors="replace").rstrip("\r")
+        self.total_lines += 1
+        self.tail.append(line)
+
+        match = LEVEL_PATTERN.search(line)
+        if not match:
+            return
+        level = match.group(1).upper()
+        level = {"WARN": "WARNING", "FATAL": "CRITICAL"}.get(level, level)
+        self.levels[level] += 1
+
+        if level in ("CRITICAL", "ERROR", "WARNING"):
+            pattern = VARIABLE_PATTERN.sub("<*>", line[match.start():])[:200]
+            if pattern in self.patterns or len(self.patterns) < self.max_patterns:
+                self.patterns[pattern] += 1
+                self.samples.setdefault(pattern, line)
+
+    def render(self, top: int = 30) -> str:
+        """Format the digest as text for the LLM prompt."""
+        levels = ", ".join(f"{level}: {count}" for level, count in self.levels.most_common()) or "none detected"
+        patterns = "\n".join(
+            f"[{count}x] {self.samples[pattern]}" for pattern, count in self.patterns.most_common(top)
+        ) or "none"
+        tail = "\n".join(self.tail)
+        return f"""Total lines: {self.total_lines}
+Lines per level: {levels}
+
+Most frequent error/warning messages:
+{patterns}
+
+Last {len(self.tail)} lines:
+{tail}"""
+
+
 class LogAnalysisAgent(BaseAgent):
     """Agent for analyzing log files for errors and patterns"""
-    
+
     def analyze(self, log_file: str, repo_path: str = None) -> str:
         """Analyze log files for errors and patterns
-        
+
         Args:
             log_file: Path to the log file to analyze
             repo_path: Optional path to repository for context
-            
+
         Returns:
             Analysis of log file
         """
@@ -17,28 +105,65 @@ class LogAnalysisAgent(BaseAgent):
             # Read log file content
             with open(log_file, 'r') as f:
                 log_content = f.read()
-            
-            # Get repository context if provided
-            repo_context = ""
-            if repo_path:
-                try:
-                    repo_data = self.analyze_repository(repo_path)
-                    repo_context = f"\n\nRepository Context:\n{repo_data['summary']}"
-                except:
-                    pass
-            
-            # Generate analysis using LLM
-            prompt = f"""Analyze the following log file and provide insights:{repo_context}
-            {log_content}
-            
-            Please provide:
-            1. Error patterns
-            2. Critical issues
-            3. Performance bottlenecks
-            4. Recommendations
-            """
-            
-            response = self.llm.invoke(prompt)
-            return response.content
+
+            return self._invoke(log_content, repo_path)
         except Exception as e:
-            return f"Error analyzing logs: {str(e)}"
\ No newline at end of file
+            return f"Error analyzing logs: {str(e)}"
+
+    def analyze_chunks(self, chunks: Iterable[bytes], repo_path: str = None) -> str:
+        """Analyze a log streamed as raw byte chunks
+
+        Args:
+            chunks: Iterable of consecutive chunks of the log file
+            repo_path: Optional path to repository for context
+
+        Returns:
+            Analysis of the log. Logs up to RAW_LOG_MAX_BYTES are sent as is;
+            larger ones are reduced to a digest built while streaming.
+        """
+        try:
+            digest = LogDigest()
+            raw = []
+            raw_size = 0
+            for chunk in chunks:
+                digest.feed(chunk)
+                # Keep the raw text only while the log is small enough to send
+                if raw is not None:
+                    raw.append(chunk)
+                    raw_size += len(chunk)
+                    if raw_size > RAW_LOG_MAX_BYTES:
+                        raw = None
+            digest.close()
+
+            if raw is not None:
+                log_content = b"".join(raw).decode('utf-8', errors='replace')
+            else:
+                log_content = digest.render()
+            return self._invoke(log_content, repo_path)
+        except Exception as e:
+            return f"Error analyzing logs: {str(e)}"
+
+    def _invoke(self, log_content: str, repo_path: str = None) -> str:
+        """Ask the LLM for insights on the given log content"""
+        # Get repository context if provided
+        repo_context = ""
+        if repo_path:
+            try:
+                repo_data = self.analyze_repository(repo_path)
+                repo_context = f"\n\nRepository Context:\n{repo_data['summary']}"
+            except:
+                pass
+
+        # Generate analysis using LLM
+        prompt = f"""Analyze the following log file and provide insights:{repo_context}
+        {log_content}
+
+        Please provide:
+        1. Error patterns
+        2. Critical issues
+        3. Performance bottlenecks
+        4. Recommendations
+        """
+
+        response = self.llm.invoke(prompt)
+        return response.content
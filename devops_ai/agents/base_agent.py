@@ -1,8 +1,10 @@
 import os
-from typing import List, Union, Dict
+from contextlib import contextmanager
+from typing import Iterator, List, Union, Dict
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 from gitingest import ingest, ingest_from_query, clone_repo, parse_query
+from git import Repo
 import urllib3
 import ssl
 import httpx  # Change from requests to httpx
@@ -88,6 +90,48 @@ Key Content Insights:
         except Exception as e:
             raise Exception(f"Error analyzing repository: {str(e)}")
     
+    @contextmanager
+    def open_repository(self, git_dir: str) -> Iterator[Repo]:
+        """Open a repository for the duration of a with block
+        
+        The Repo is closed on exit, which stops the git helper processes it
+        spawns, so open it once per analysis rather than once per file.
+        
+        Args:
+            git_dir: Path to a bare repository or a working copy's .git directory
+            
+        Yields:
+            The opened repository
+        """
+        repo = Repo(git_dir)
+        try:
+            yield repo
+        finally:
+            repo.close()
+    
+    def list_repository_files(self, repo: Repo) -> List[str]:
+        """List the files committed at HEAD straight from the git object store
+        
+        Args:
+            repo: Repository opened with open_repository
+            
+        Returns:
+            Repository-relative paths of all files in the HEAD tree
+        """
+        return [item.path for item in repo.head.commit.tree.traverse() if item.type == "blob"]
+    
+    def read_repository_file(self, repo: Repo, path: str) -> bytes:
+        """Read a file committed at HEAD from the git object store
+        
+        Args:
+            repo: Repository opened with open_repository
+            path: Repository-relative path of the file
+            
+        Returns:
+            Raw file contents
+        """
+        return repo.head.commit.tree[path].data_stream.read()
+    
     def clone_repository(self, query: dict) -> str:
         """Clone a repository from a URL to the current working directory
         
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Iterator, List, Union
 from .base_agent import BaseAgent
 
 class CodeQualityAgent(BaseAgent):
@@ -21,27 +21,47 @@ class CodeQualityAgent(BaseAgent):
             Analysis of code quality and maintainability
         """
         try:
-            # Get repository analysis data from base agent with enhanced parameters
-            repo_data = self.analyze_repository(
-                repo_path=repo_path,
-                max_file_size=max_file_size,
-                include_patterns=include_patterns,
-                exclude_patterns=exclude_patterns,
-                output=output
-            )
-            
-            # Generate analysis using LLM
-            prompt = f"""Analyze the code quality and maintainability of the repository based on this information:
-            {repo_data['repo_info']}
-            
-            Please provide:
-            1. Code smells and anti-patterns
-            2. Maintainability issues
-            3. Suggestions for improvement
-            4. Best practices
-            """
-            
+            prompt = self._build_prompt(repo_path, max_file_size, include_patterns, exclude_patterns, output)
             response = self.llm.invoke(prompt)
             return response.content
         except Exception as e:
-            return f"Error analyzing code quality: {str(e)}"
\ No newline at end of file
+            return f"Error analyzing code quality: {str(e)}"
+    
+    def analyze_stream(self, repo_path: str, max_file_size: int = 10485760,
+                      include_patterns: Union[List[str], str] = None,
+                      exclude_patterns: Union[List[str], str] = None,
+                      output: str = None) -> Iterator[str]:
+        """Same as analyze, but yields the LLM response as it is generated
+        
+        Yields:
+            Successive pieces of the code quality analysis
+
+        Raises:
+            Exception: If the analysis fails, possibly after some pieces were
+                yielded, so a partial result is never mistaken for a full one
+        """
+        prompt = self._build_prompt(repo_path, max_file_size, include_patterns, exclude_patterns, output)
+        for chunk in self.llm.stream(prompt):
+            yield chunk.content
+    
+    def _build_prompt(self, repo_path, max_file_size, include_patterns, exclude_patterns, output) -> str:
+        """Build the code quality prompt from the repository analysis"""
+        # Get repository analysis data from base agent with enhanced parameters
+        repo_data = self.analyze_repository(
+            repo_path=repo_path,
+            max_file_size=max_file_size,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            output=output
+        )
+        
+        # Generate analysis using LLM
+        return f"""Analyze the code quality and maintainability of the repository based on this information:
+        {repo_data['repo_info']}
+        
+        Please provide:
+        1. Code smells and anti-patterns
+        2. Maintainability issues
+        3. Suggestions for improvement
+        4. Best practices
+        """
\ No newline at end of file
@@ -1,24 +1,48 @@
+from typing import Dict, List, Union
 from .base_agent import BaseAgent
 
 class ContributorsAgent(BaseAgent):
     """Agent for analyzing contributor statistics and activity"""
     
-    def analyze(self, repo_path: str) -> str:
+    def analyze(self, repo_path: str, max_file_size: int = 10485760,
+               include_patterns: Union[List[str], str] = None,
+               exclude_patterns: Union[List[str], str] = None,
+               output: str = None,
+               author_counts: Dict[str, int] = None) -> str:
         """Show contributor statistics and activity for the given repository.
         
         Args:
             repo_path: Path to local directory or GitHub repository URL
+            max_file_size: Maximum file size in bytes to analyze (default: 10MB)
+            include_patterns: List of glob patterns to include (e.g., ['*.py', '*.js'])
+            exclude_patterns: List of glob patterns to exclude (e.g., ['**/node_modules/**'])
+            output: Optional path to save the analysis results
+            author_counts: Optional commit counts per author email from the git history
             
         Returns:
             Analysis of contributor statistics
         """
         try:
             # Get repository analysis data from base agent
-            repo_data = self.analyze_repository(repo_path)
+            repo_data = self.analyze_repository(
+                repo_path=repo_path,
+                max_file_size=max_file_size,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+                output=output
+            )
+            
+            # Include real commit counts when the caller read them from git
+            commit_stats = ""
+            if author_counts:
+                ranked = sorted(author_counts.items(), key=lambda item: item[1], reverse=True)
+                commit_stats = "\n\nCommits per author:\n" + "\n".join(
+                    f"{email}: {count}" for email, count in ranked
+                )
             
             # Generate analysis using LLM
             prompt = f"""Analyze the repository and provide contributor statistics based on this information:
-            {repo_data['repo_info']}
+            {repo_data['repo_info']}{commit_stats}
             
             Please provide:
             1. Top contributors
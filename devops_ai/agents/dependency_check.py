@@ -1,20 +1,34 @@
+from typing import List, Union
 from .base_agent import BaseAgent
 
 class DependencyCheckAgent(BaseAgent):
     """Agent for checking outdated or vulnerable dependencies"""
     
-    def analyze(self, repo_path: str) -> str:
+    def analyze(self, repo_path: str, max_file_size: int = 10485760,
+               include_patterns: Union[List[str], str] = None,
+               exclude_patterns: Union[List[str], str] = None,
+               output: str = None) -> str:
         """Check for outdated or vulnerable dependencies in the given repository.
         
         Args:
             repo_path: Path to local directory or GitHub repository URL
+            max_file_size: Maximum file size in bytes to analyze (default: 10MB)
+            include_patterns: List of glob patterns to include (e.g., ['*.py', '*.js'])
+            exclude_patterns: List of glob patterns to exclude (e.g., ['**/node_modules/**'])
+            output: Optional path to save the analysis results
             
         Returns:
             Analysis of dependencies
         """
         try:
             # Get repository analysis data from base agent
-            repo_data = self.analyze_repository(repo_path)
+            repo_data = self.analyze_repository(
+                repo_path=repo_path,
+                max_file_size=max_file_size,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+                output=output
+            )
             
             # Generate analysis using LLM
             prompt = f"""Check the repository for outdated or vulnerable dependencies based on this information:
@@ -24,8 +24,12 @@ class DockerGenerationAgent(BaseAgent):
     def analyze(self, repo_path: str, max_file_size: int = 10485760,
                 include_patterns: Union[List[str], str] = None,
                 exclude_patterns: Union[List[str], str] = None,
-                output: str = None) -> str:
-        """Analyze repository structure and generate Docker files"""
+                output: str = None, git_session=None, git_dir: str = None,
+                output_dir: str = None) -> str:
+        """Analyze repository structure and generate Docker files
+
+        The files are written to output_dir when given, otherwise into repo_path.
+        """
         try:
             abs_repo_path = os.path.abspath(repo_path)
             logger.info(f"Starting analysis for repo: {repo_path}")
@@ -42,15 +46,18 @@ class DockerGenerationAgent(BaseAgent):
 
             if 'repo_path' not in repo_data:
                 repo_data['repo_path'] = abs_repo_path
+            if git_dir:
+                repo_data['git_dir'] = git_dir
 
-            dockerfile_content, compose_content = self._generate_docker_files(repo_data)
+            dockerfile_content, compose_content = self._generate_docker_files(repo_data, git_session)
 
             logger.info(f"Docker files generated. Services: {list(dockerfile_content.keys())}")
             logger.info(f"Compose content length: {len(compose_content) if compose_content else 0}")
 
-            self._write_docker_files(abs_repo_path, dockerfile_content, compose_content)
+            abs_output_dir = os.path.abspath(output_dir) if output_dir else abs_repo_path
+            self._write_docker_files(abs_output_dir, dockerfile_content, compose_content)
 
-            return f"Successfully generated Docker files for {repo_path}:\n" + \
+            return f"Successfully generated Docker files for {repo_path} in {abs_output_dir}:\n" + \
                    f"Dockerfile(s): {', '.join(list(dockerfile_content.keys()))}\n" + \
                    f"docker-compose.yml: {'Created' if compose_content else 'Not created'}"
 
@@ -58,7 +65,66 @@ class DockerGenerationAgent(BaseAgent):
             logger.error(f"Error generating Docker files: {str(e)}", exc_info=True)
             return f"Error generating Docker files: {str(e)}"
 
-    def _generate_docker_files(self, repo_data: Dict[str, Any]) -> tuple:
+    def _read_key_files(self, repo_path: str = None, git_dir: str = None,
+                        git_session=None) -> Dict[str, str]:
+        """Read the manifests and sources most useful for detecting the stack
+
+        Files are listed from the committed tree when git_dir is given,
+        falling back to walking repo_path if the tree cannot be read. Contents
+        come from git_session when given, otherwise from repo_path on disk.
+        """
+        candidates = None
+        if git_dir:
+            # Walk the committed tree in the object store instead of the disk
+            try:
+                with self.open_repository(git_dir) as repo:
+                    candidates = self.list_repository_files(repo)
+            except Exception as e:
+                logger.warning(f"Could not read tree from {git_dir}, falling back to {repo_path}: {e}")
+        if candidates is None:
+            candidates = [
+                os.path.relpath(os.path.join(root, fname), repo_path)
+                for root, _, files in os.walk(repo_path)
+                for fname in files
+            ] if repo_path else []
+
+        key_files = []
+        for candidate in candidates:
+            fname = os.path.basename(candidate)
+            if fname.lower() in {
+                "requirements.txt", "package.json", "pom.xml", "build.gradle",
+                "composer.json", "gemfile", "cargo.toml", "setup.py",
+                "environment.yml", "pipfile", "makefile", "dockerfile"
+            } or fname.endswith((
+                ".py", ".js", ".ts", ".go", ".java", ".cs", ".rb", ".php", ".rs",
+                ".cpp", ".c", ".sh", ".pl", ".scala", ".kt", ".swift", ".dart",
+                ".m", ".r", ".jl", ".ex", ".exs", ".clj", ".cljs", ".groovy",
+                ".lua", ".hs", ".sql", ".json", ".yml", ".yaml"
+            )):
+                key_files.append(candidate)
+
+        file_contents = {}
+        for fname in key_files[:10]:  # Limit to 10 files for prompt size
+            if git_session is not None:
+                # Serve committed files from the long-lived cat-file process
+                try:
+                    blob = git_session.read(f"HEAD:{fname.replace(os.sep, '/')}")
+                    file_contents[fname] = blob.decode('utf-8')[:2000]
+                    continue
+                except (KeyError, OSError, UnicodeDecodeError):
+                    pass
+            if not repo_path:
+                continue
+            fpath = os.path.join(repo_path, fname)
+            if os.path.exists(fpath):
+                try:
+                    with open(fpath, 'r', encoding='utf-8') as f:
+                        file_contents[fname] = f.read()[:2000]
+                except Exception as e:
+                    file_contents[fname] = f"[Error reading file: {e}]"
+        return file_contents
+
+    def _generate_docker_files(self, repo_data: Dict[str, Any], git_session=None) -> tuple:
         """Generate Dockerfile(s) and docker-compose.yml content using LangChain + OpenAI"""
         repo_structure = repo_data.get('tree', {})
         repo_path = repo_data.get('repo_path', None)
@@ -66,32 +132,8 @@ class DockerGenerationAgent(BaseAgent):
         logger.debug(f"[DEBUG] Repository structure (tree): {repo_structure}")
 
         # Extract contents of key files for better LLM context
-        key_files = []
-        if repo_path:
-            for root, _, files in os.walk(repo_path):
-                for fname in files:
-                    if fname.lower() in {
-                        "requirements.txt", "package.json", "pom.xml", "build.gradle",
-                        "composer.json", "gemfile", "cargo.toml", "setup.py",
-                        "environment.yml", "pipfile", "makefile", "dockerfile"
-                    } or fname.endswith((
-                        ".py", ".js", ".ts", ".go", ".java", ".cs", ".rb", ".php", ".rs",
-                        ".cpp", ".c", ".sh", ".pl", ".scala", ".kt", ".swift", ".dart",
-                        ".m", ".r", ".jl", ".ex", ".exs", ".clj", ".cljs", ".groovy",
-                        ".lua", ".hs", ".sql", ".json", ".yml", ".yaml"
-                    )):
-                        key_files.append(os.path.relpath(os.path.join(root, fname), repo_path))
-
-        file_contents = {}
-        if repo_path:
-            for fname in key_files[:10]:  # Limit to 10 files for prompt size
-                fpath = os.path.join(repo_path, fname)
-                if os.path.exists(fpath):
-                    try:
-                        with open(fpath, 'r', encoding='utf-8') as f:
-                            file_contents[fname] = f.read()[:2000]
-                    except Exception as e:
-                        file_contents[fname] = f"[Error reading file: {e}]"
+        git_dir = repo_data.get('git_dir', None)
+        file_contents = self._read_key_files(repo_path, git_dir, git_session)
 
         prompt = f"""Analyze the following repository structure and key file contents. Detect the main programming languages, frameworks, and build tools.
 
@@ -91,7 +91,7 @@ Please provide your recommendation in the following JSON format:
                 "alternative_options": []
             }
 
-    def analyze(self, query: str = "", repo_path: str = None, generate_iac: bool = False, deploy: bool = False, iac_format: str = "cloudformation") -> str:
+    def analyze(self, query: str = "", repo_path: str = None, generate_iac: bool = False, deploy: bool = False, iac_format: str = "cloudformation", git_dir: str = None, output_dir: str = None) -> str:
         """
         Get infrastructure recommendations based on repository context or user query.
         Optionally generate Infrastructure as Code (IAC) and deploy to AWS.
@@ -102,6 +102,8 @@ Please provide your recommendation in the following JSON format:
             generate_iac: Whether to generate IAC templates (CloudFormation or Ansible)
             deploy: Whether to deploy the infrastructure to AWS
             iac_format: Format of IAC to generate ("cloudformation" or "ansible")
+            git_dir: Optional git directory to read key files from instead of walking repo_path
+            output_dir: Optional directory for the report and IAC files instead of repo_path
 
         Returns:
             str: Infrastructure recommendations in structured format
@@ -123,7 +125,7 @@ Please provide your recommendation in the following JSON format:
                     detected_services = self._detect_services_from_repo(repo_data)
                     repo_summary = {
                         "structure": repo_data.get("tree", {}),
-                        "key_files": self._extract_key_file_contents(repo_path),
+                        "key_files": self._extract_key_file_contents(repo_path, git_dir=git_dir),
                         "services": detected_services
                     }
 
@@ -227,8 +229,11 @@ Please provide your response in the following JSON format, wrapped in triple bac
                 comp["aws_ec2_instance_type"] = instance_analysis["instance_type"]
                 comp["instance_analysis"] = instance_analysis
 
+            # Generated files go to output_dir when given, otherwise into the repository
+            output_path = output_dir or repo_path
+
             # Write report or logs if needed
-            self._save_infra_recommendation_report(repo_path, json_response)
+            self._save_infra_recommendation_report(output_path, json_response)
             
             # Generate IAC if requested
             iac_output = ""
@@ -236,14 +241,14 @@ Please provide your response in the following JSON format, wrapped in triple bac
                 try:
                     if iac_format.lower() == "ansible":
                         iac_templates = self._generate_ansible_playbooks(json_response)
-                        self._save_ansible_playbooks(repo_path, iac_templates)
+                        self._save_ansible_playbooks(output_path, iac_templates)
                         iac_output = "\n\n=== INFRASTRUCTURE AS CODE GENERATED ===\n"
-                        iac_output += f"Ansible playbooks have been generated in {repo_path}/ansible/\n"
+                        iac_output += f"Ansible playbooks have been generated in {output_path}/ansible/\n"
                     else:  # Default to CloudFormation
                         iac_templates = self._generate_cloudformation_templates(json_response)
-                        self._save_cloudformation_templates(repo_path, iac_templates)
+                        self._save_cloudformation_templates(output_path, iac_templates)
                         iac_output = "\n\n=== INFRASTRUCTURE AS CODE GENERATED ===\n"
-                        iac_output += f"CloudFormation templates have been generated in {repo_path}/cloudformation/\n"
+                        iac_output += f"CloudFormation templates have been generated in {output_path}/cloudformation/\n"
                 except Exception as e:
                     logger.error(f"Error generating IAC: {str(e)}", exc_info=True)
                     iac_output = f"\n\nError generating Infrastructure as Code: {str(e)}"
@@ -257,9 +262,9 @@ Please provide your response in the following JSON format, wrapped in triple bac
                 if self.aws_credentials:
                     try:
                         if iac_format.lower() == "ansible":
-                            deployment_result = self._deploy_with_ansible(repo_path, json_response)
+                            deployment_result = self._deploy_with_ansible(output_path, json_response)
                         else:
-                            deployment_result = self._deploy_to_aws(repo_path, json_response)
+                            deployment_result = self._deploy_to_aws(output_path, json_response)
                         deployment_output = "\n\n=== DEPLOYMENT STATUS ===\n"
                         deployment_output += deployment_result
                     except Exception as e:
@@ -275,13 +280,33 @@ Please provide your response in the following JSON format, wrapped in triple bac
             logger.error(f"Error generating infrastructure suggestion: {str(e)}", exc_info=True)
             return f"Error generating infrastructure suggestions: {str(e)}"
 
-    def _extract_key_file_contents(self, repo_path: str, max_files: int = 5, max_chars: int = 2000) -> Dict[str, str]:
+    def _extract_key_file_contents(self, repo_path: str, max_files: int = 5, max_chars: int = 2000,
+                                   git_dir: str = None) -> Dict[str, str]:
         """Extract content from key files for LLM context"""
+        key_file_names = {"package.json", "requirements.txt", "Dockerfile", "docker-compose.yml",
+                          "pom.xml", "build.gradle", "setup.py", "Gemfile", ".gitignore"}
+
+        if git_dir:
+            # Read straight from the object store, no working directory needed
+            try:
+                with self.open_repository(git_dir) as repo:
+                    key_files = [path for path in self.list_repository_files(repo)
+                                 if os.path.basename(path).lower() in key_file_names]
+                    file_contents = {}
+                    for fname in key_files[:max_files]:
+                        try:
+                            data = self.read_repository_file(repo, fname)
+                            file_contents[fname] = data.decode("utf-8")[:max_chars]
+                        except Exception as e:
+                            file_contents[fname] = f"[ERROR reading file: {e}]"
+                return file_contents
+            except Exception as e:
+                logger.warning(f"Could not read tree from {git_dir}, falling back to {repo_path}: {e}")
+
         key_files = []
         for root, _, files in os.walk(repo_path):
             for fname in files:
-                if fname.lower() in {"package.json", "requirements.txt", "Dockerfile", "docker-compose.yml",
-                                     "pom.xml", "build.gradle", "setup.py", "Gemfile", ".gitignore"}:
+                if fname.lower() in key_file_names:
                     key_files.append(os.path.relpath(os.path.join(root, fname), repo_path))
 
         file_contents = {}
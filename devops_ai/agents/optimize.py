@@ -1,3 +1,4 @@
+from typing import Iterator
 from .base_agent import BaseAgent
 
 class OptimizeAgent(BaseAgent):
@@ -14,27 +15,42 @@ class OptimizeAgent(BaseAgent):
             Optimization recommendations
         """
         try:
-            # Get repository context if provided
-            repo_context = ""
-            if repo_path:
-                try:
-                    repo_data = self.analyze_repository(repo_path)
-                    repo_context = f"\n\nRepository Context:\n{repo_data['repo_info']}"
-                except:
-                    pass
-            
-            # Generate analysis using LLM
-            prompt = f"""Based on the following context, provide optimization recommendations:{repo_context}
-            {context}
-            
-            Please provide:
-            1. Performance bottlenecks
-            2. Resource utilization
-            3. Optimization strategies
-            4. Implementation steps
-            """
-            
-            response = self.llm.invoke(prompt)
+            response = self.llm.invoke(self._build_prompt(context, repo_path))
             return response.content
         except Exception as e:
-            return f"Error generating optimization recommendations: {str(e)}"
\ No newline at end of file
+            return f"Error generating optimization recommendations: {str(e)}"
+    
+    def analyze_stream(self, context: str = "", repo_path: str = None) -> Iterator[str]:
+        """Same as analyze, but yields the LLM response as it is generated
+        
+        Yields:
+            Successive pieces of the optimization recommendations
+
+        Raises:
+            Exception: If generation fails, possibly after some pieces were
+                yielded, so a partial result is never mistaken for a full one
+        """
+        for chunk in self.llm.stream(self._build_prompt(context, repo_path)):
+            yield chunk.content
+    
+    def _build_prompt(self, context: str, repo_path: str = None) -> str:
+        """Build the optimization prompt, with repository context if available"""
+        # Get repository context if provided
+        repo_context = ""
+        if repo_path:
+            try:
+                repo_data = self.analyze_repository(repo_path)
+                repo_context = f"\n\nRepository Context:\n{repo_data['repo_info']}"
+            except:
+                pass
+        
+        # Generate analysis using LLM
+        return f"""Based on the following context, provide optimization recommendations:{repo_context}
+        {context}
+        
+        Please provide:
+        1. Performance bottlenecks
+        2. Resource utilization
+        3. Optimization strategies
+        4. Implementation steps
+        """
\ No newline at end of file
@@ -12,7 +12,6 @@ from dotenv import load_dotenv
 from .core import DevOpsAITools
 from .dashboard import TextDashboard
 from devops_ai.agents.infra_suggest import InfraSuggestAgent  # Assuming this contains initialized InfraSuggestAgent
-import pkg_resources
 
 # Initialize Typer app
 app = typer.Typer(help="SynteraAI - AI-powered DevOps CLI tool")
@@ -144,6 +143,9 @@ def optimize(
 @app.command()
 def version():
     """Show version information for syntera-ai and its dependencies."""
+    # pkg_resources scans every installed distribution on import, so only
+    # the commands that need it pay for it
+    import pkg_resources
     try:
         # Get syntera-ai version
         syntera_version = pkg_resources.get_distribution("syntera-ai").version
@@ -163,6 +165,7 @@ def version():
 @app.command()
 def dependencies():
     """Show all dependencies and their versions used in the project."""
+    import pkg_resources
     try:
         # Get all installed packages
         installed_packages = {pkg.key: pkg.version for pkg in pkg_resources.working_set}
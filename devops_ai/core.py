@@ -49,6 +49,21 @@ class DevOpsAITools:
         except Exception as e:
             return f"Error analyzing code quality: {str(e)}"
 
+    def _code_quality_stream(self, repo_path: str, max_file_size: int = 10485760,
+                             include_patterns = None, exclude_patterns = None, output = None):
+        """Stream the code quality analysis for the given repository as it is generated.
+
+        Errors are raised rather than yielded so callers can tell a partial
+        stream from a complete one.
+        """
+        yield from self.code_quality_agent.analyze_stream(
+            repo_path=repo_path,
+            max_file_size=max_file_size,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            output=output
+        )
+
     def _analyze_logs(self, log_file: str) -> str:
         """Analyze log files for errors and patterns"""
         try:
@@ -56,13 +71,23 @@ class DevOpsAITools:
         except Exception as e:
             return f"Error analyzing logs: {str(e)}"
 
-    def _infra_suggest(self, context=None, repo_path=None, generate_iac=False):
+    def _analyze_logs_chunks(self, chunks) -> str:
+        """Analyze a log streamed as byte chunks without buffering the whole file"""
+        try:
+            return self.log_analysis_agent.analyze_chunks(chunks)
+        except Exception as e:
+            return f"Error analyzing logs: {str(e)}"
+
+    def _infra_suggest(self, context=None, repo_path=None, generate_iac=False, git_dir=None,
+                       output_dir=None):
         """Get infrastructure recommendations"""
         try:
             return self.infra_suggest_agent.analyze(
                 query=context,
                 repo_path=repo_path,
-                generate_iac=generate_iac
+                generate_iac=generate_iac,
+                git_dir=git_dir,
+                output_dir=output_dir
             )
         except Exception as e:
             return f"Error getting infrastructure recommendations: {str(e)}"
@@ -89,6 +114,14 @@ class DevOpsAITools:
         except Exception as e:
             return f"Error getting optimization recommendations: {str(e)}"
 
+    def _optimize_stream(self, context: str = ""):
+        """Stream performance optimization recommendations as they are generated
+
+        Errors are raised rather than yielded so callers can tell a partial
+        stream from a complete one.
+        """
+        yield from self.optimize_agent.analyze_stream(context)
+
     def _dependency_check(self, repo_path: str, max_file_size: int = 10485760,
                       include_patterns = None, exclude_patterns = None, output = None) -> str:
         """Check for outdated or vulnerable dependencies in the given repository."""
@@ -104,7 +137,8 @@ class DevOpsAITools:
             return f"Error checking dependencies: {str(e)}"
 
     def _contributors(self, repo_path: str, max_file_size: int = 10485760,
-                       include_patterns = None, exclude_patterns = None, output = None) -> str:
+                       include_patterns = None, exclude_patterns = None, output = None,
+                       author_counts = None) -> str:
         """Show contributor statistics and activity for the given repository."""
         try:
             return self.contributors_agent.analyze(
@@ -112,7 +146,8 @@ class DevOpsAITools:
                 max_file_size=max_file_size,
                 include_patterns=include_patterns,
                 exclude_patterns=exclude_patterns,
-                output=output
+                output=output,
+                author_counts=author_counts
             )
         except Exception as e:
             return f"Error fetching contributor statistics: {str(e)}"
@@ -143,7 +178,8 @@ class DevOpsAITools:
             return f"Error analyzing repository: {str(e)}"
 
     def _docker_generation(self, repo_path: str, max_file_size: int = 10485760,
-                      include_patterns = None, exclude_patterns = None, output = None) -> str:
+                      include_patterns = None, exclude_patterns = None, output = None,
+                      git_session = None, git_dir = None, output_dir = None) -> str:
         """Generate Docker and docker-compose files for the given repository.
         
         Args:
@@ -152,6 +188,9 @@ class DevOpsAITools:
             include_patterns: List of glob patterns to include (e.g., ['*.py', '*.js'])
             exclude_patterns: List of glob patterns to exclude (e.g., ['**/node_modules/**'])
             output: Optional path to save the analysis results
+            git_session: Optional GitSession used to read file contents from the repository
+            git_dir: Optional git directory to enumerate files from instead of walking repo_path
+            output_dir: Optional directory to write the generated files to instead of repo_path
             
         Returns:
             Results of Docker file generation
@@ -162,7 +201,10 @@ class DevOpsAITools:
                 max_file_size=max_file_size,
                 include_patterns=include_patterns,
                 exclude_patterns=exclude_patterns,
-                output=output
+                output=output,
+                git_session=git_session,
+                git_dir=git_dir,
+                output_dir=output_dir
             )
         except Exception as e:
             return f"Error generating Docker files: {str(e)}"
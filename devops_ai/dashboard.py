@@ -68,9 +68,11 @@ class TextDashboard:
             "[bold green]►[/bold green] [bold cyan]Enter the GitHub repository URL to work on[/bold cyan]",
             default="https://github.com/example/repo "
         )
-        clone_output, self.local_repo_path = self.tool_handlers.set_repository(self.github_repo_url)
-        if clone_output:
-            self._display_result(clone_output, "Git Clone Output")
+        # Clone in the background so it overlaps with picking a tool; a failed
+        # clone is reported as the result of the first repository tool run
+        _, self.local_repo_path = self.tool_handlers.set_repository(
+            self.github_repo_url, background=True
+        )
 
         handlers = {
             "1": self.tool_handlers.analyze_logs,
@@ -115,6 +117,8 @@ class TextDashboard:
                     self.layout["input"].update(create_input_panel())
                     live.refresh()
 
+        self.tool_handlers.close()
+
     def _render_tools_panel(self):
         tools = [
             {"key": "1", "icon": "📊", "name": "Analyze Logs", "desc": "Analyze log files for patterns and errors"},
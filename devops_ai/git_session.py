@@ -0,0 +1,79 @@
+import subprocess
+import threading
+from typing import Optional
+
+
+class GitSession:
+    """A long-lived ``git cat-file --batch`` process for reading git objects.
+
+    Spawning git once and serving lookups over its stdin/stdout pipe avoids
+    paying fork+exec for every ``git show`` style call. The process is
+    started lazily on the first read and must be released with ``close()``
+    (or by using the session as a context manager).
+    """
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", self.repo_path, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        return self._proc
+
+    def read(self, spec: str) -> bytes:
+        """Return the raw contents of the object named by ``spec``.
+
+        Args:
+            spec: Any object name git understands, e.g. ``HEAD:setup.py``
+
+        Returns:
+            The object contents
+
+        Raises:
+            KeyError: If the object does not exist
+        """
+        with self._lock:
+            proc = self._ensure_started()
+            proc.stdin.write(spec.encode() + b"\n")
+            proc.stdin.flush()
+
+            # Header is "<sha> <type> <size>\n" or "<spec> missing\n"
+            header = proc.stdout.readline().decode().rstrip("\n")
+            if not header or header.endswith((" missing", " ambiguous")):
+                raise KeyError(spec)
+            size = int(header.rsplit(" ", 1)[1])
+
+            # Object contents are followed by a trailing newline
+            data = b""
+            while len(data) < size + 1:
+                chunk = proc.stdout.read(size + 1 - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return data[:size]
+
+    def close(self) -> None:
+        """Terminate the underlying git process."""
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
+
+    def __enter__(self) -> "GitSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -1,10 +1,269 @@
 import os
+import re
+import asyncio
+import time
+import shutil
+import hashlib
+import threading
+import contextlib
 import subprocess
-from typing import Optional, Tuple
+from collections import Counter
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from git import Repo, GitCommandError, InvalidGitRepositoryError, NoSuchPathError
 from rich.console import Console
+from rich.live import Live
+from rich.markdown import Markdown
+from rich.spinner import Spinner
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 from ..core import DevOpsAITools
+from ..git_session import GitSession
+
+# Matches the percentage git prints on stderr while receiving pack objects
+_CLONE_PROGRESS_RE = re.compile(r"Receiving objects:\s+(\d+)%")
+
+# Protocol v2 trims ref advertisement, pack.threads=0 lets index-pack use
+# every core and submodules are fetched in parallel
+_GIT_TUNING = ["-c", "protocol.version=2", "-c", "pack.threads=0", "-c", "submodule.fetchJobs=8"]
+
+# Clones are cached per repository URL so they survive across sessions and
+# working directories
+CLONE_CACHE_DIR = Path.home() / ".devops_ai" / "cache" / "clones"
+CLONE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+CLONE_CACHE_MAX_BYTES = 10 * 1024 ** 3  # 10GB
+# Measuring the cache walks every file, so the size cap is enforced at most
+# this often
+CLONE_CACHE_SIZE_CHECK_INTERVAL = 24 * 60 * 60  # 1 day
+
+# Shared by all handlers so repositories can be cloned while the user is
+# still choosing a tool
+_CLONE_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Results that cannot be keyed on a commit expire after this many seconds
+RESULT_CACHE_TTL = 300
+
+# Minimum seconds between re-renders of streamed output
+STREAM_RENDER_INTERVAL = 0.1
+
+
+def _git_ingest(h: "ToolHandlers") -> str:
+    if not hasattr(h.devops_tools, "_git_ingest"):
+        return f"Git ingest functionality for '{h.github_repo_url}' is under development."
+    return h._cached("git_ingest", lambda: h.devops_tools._git_ingest(h.github_repo_url))
+
+
+def _infrastructure(h: "ToolHandlers", context: str = "") -> str:
+    if not h.github_repo_url:
+        return h.devops_tools._infra_suggest(context=context, generate_iac=True)
+    # Use local repo path for deeper analysis and generate IAC. Not memoized:
+    # the templates and report are written to disk on every run
+    return h.devops_tools._infra_suggest(
+        context="",
+        repo_path=h.local_repo_path,
+        generate_iac=True,
+        git_dir=h.git_dir,
+        output_dir=h._ensure_output_dir()
+    )
+
+
+class _Tool(NamedTuple):
+    label: str
+    title: str
+    error_title: str
+    compute: Callable[..., str]
+    requires_repo: bool
+    # Interactive variant that renders the response live while it streams
+    stream: Optional[Callable[..., str]] = None
+    # Reads the local clone whenever a repository is bound, even though it
+    # also works without one
+    uses_clone: bool = False
+    # Variant run by run_all when compute would need user input
+    batch: Optional[Callable[..., str]] = None
+
+
+# Every tool dispatched through ToolHandlers._dispatch; compute (or stream,
+# when set) is called as compute(handlers, *args)
+TOOLS: Dict[str, _Tool] = {
+    "infrastructure": _Tool(
+        "Generating infrastructure suggestions...", "🏗️ Infrastructure Recommendations",
+        "🏗️ Infrastructure Error", _infrastructure, False, uses_clone=True,
+    ),
+    "security_scan": _Tool(
+        "Scanning for security issues...", "🔒 Security Scan Results",
+        "🔒 Security Scan Error", lambda h, target="": h.devops_tools._security_scan(target), False,
+        # Batch mode cannot prompt for a target, so it scans the bound repository
+        batch=lambda h: h._cached("security_scan", lambda: h.devops_tools._security_scan(
+            repo_path=h.local_repo_path
+        )),
+    ),
+    "optimize": _Tool(
+        "Generating optimization recommendations...", "⚡ Optimization Recommendations",
+        "⚡ Optimization Error", lambda h, context="": h.devops_tools._optimize(context), False,
+        stream=lambda h, context="": h._render_stream(
+            "Generating optimization recommendations...", h.devops_tools._optimize_stream(context)
+        ),
+    ),
+    "git_ingest": _Tool(
+        "Ingesting repository...", "⚙️ Git Ingest Results",
+        "⚙️ Git Ingest Error", _git_ingest, True,
+    ),
+    "code_quality": _Tool(
+        "Analyzing code quality...", "🧑‍💻 Code Quality Analysis",
+        "🧑‍💻 Code Quality Error",
+        lambda h: h._cached("code_quality", lambda: h.devops_tools._code_quality(h.github_repo_url)),
+        True,
+        stream=lambda h: h._cached("code_quality", lambda: h._render_stream(
+            "Analyzing code quality...", h.devops_tools._code_quality_stream(h.github_repo_url)
+        )),
+    ),
+    "dependency_check": _Tool(
+        "Checking dependencies...", "📦 Dependency Check Results",
+        "📦 Dependency Check Error",
+        lambda h: h._cached("dependency_check", lambda: h.devops_tools._dependency_check(h.github_repo_url)),
+        True,
+    ),
+    "contributors": _Tool(
+        "Fetching contributor statistics...", "👥 Contributor Statistics",
+        "👥 Contributors Error",
+        lambda h: h._cached("contributors", lambda: h.devops_tools._contributors(
+            h.github_repo_url, author_counts=h._author_counts()
+        )),
+        True,
+    ),
+    # Not memoized: the Docker files are written to disk on every run
+    "docker_generation": _Tool(
+        "Analyzing repository and generating Docker files...", "🐳 Docker Generation Results",
+        "🐳 Docker Generation Error",
+        lambda h: h.devops_tools._docker_generation(
+            h.local_repo_path, git_session=h._git_session, git_dir=h.git_dir,
+            output_dir=h._ensure_output_dir()
+        ),
+        True,
+    ),
+}
+
+# Tools that need no user input and can run concurrently against the bound
+# repository
+BATCH_TOOLS = ("code_quality", "dependency_check", "contributors", "security_scan", "docker_generation")
+
+
+LOG_READ_CHUNK = 1 << 20  # 1MiB
+
+
+def _iter_chunks(path: str, size: int = LOG_READ_CHUNK) -> Iterator[bytes]:
+    """Yield the contents of ``path`` in fixed-size chunks."""
+    with open(path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(size), b""):
+            yield chunk
+
+
+# Label-independent Progress columns, built once and shared by every display
+_SPINNER = SpinnerColumn(finished_text="[bold green]✓[/bold green]")
+_BAR = BarColumn(bar_width=40)
+_WAIT = TextColumn("[bold cyan]Please wait[/bold cyan]")
+_DESCRIPTION = TextColumn("[bold cyan]{task.description}[/bold cyan]")
+
+
+def _new_progress(label: Optional[str] = None, wait: bool = True, bar: bool = True) -> Progress:
+    """Create a Progress from the shared columns.
+
+    Without a ``label`` each task's own description is shown instead. Pass
+    ``bar=False`` for work with no measurable progress so only the spinner
+    is drawn.
+    """
+    columns = [_SPINNER, TextColumn(f"[bold cyan]{label}[/bold cyan]") if label else _DESCRIPTION]
+    if bar:
+        columns.append(_BAR)
+    if wait:
+        columns.append(_WAIT)
+    return Progress(*columns)
+
+
+def _maybe_progress(label: str, fn: Callable[[], str], min_elapsed: float = 0.25) -> str:
+    """Run ``fn`` and only show a Progress display if it is still running
+    after ``min_elapsed`` seconds, so fast (e.g. cached) tools skip Rich's
+    live-render setup entirely. Exceptions raised by ``fn`` propagate.
+
+    ``fn`` runs on a daemon thread rather than an executor, whose shutdown
+    would wait for the call to finish and so swallow Ctrl-C until it did.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            # Anything left uncaught (e.g. SystemExit) would leave the waiter hanging
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    try:
+        return future.result(timeout=min_elapsed)
+    except FutureTimeoutError:
+        pass
+
+    # The tools are a single opaque call, so there is nothing to measure
+    with _new_progress(label, bar=False) as progress:
+        progress.add_task(label, total=None)
+        return future.result()
+
+
+def _repo_name(github_repo_url: str) -> str:
+    """Return the repository name at the end of ``github_repo_url``."""
+    repo_name = github_repo_url.rstrip('/').split('/')[-1]
+    return repo_name[:-4] if repo_name.endswith(".git") else repo_name
+
+
+def _dir_size(path: Path) -> int:
+    """Return the total size in bytes of all files under ``path``."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for fname in files:
+            try:
+                total += os.lstat(os.path.join(root, fname)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _prune_clone_cache(keep: Optional[Path] = None) -> None:
+    """Remove cached clones older than the TTL, then evict least recently
+    used entries until the cache fits under ``CLONE_CACHE_MAX_BYTES``.
+
+    The size check is skipped when there is nothing else to evict or when it
+    already ran within ``CLONE_CACHE_SIZE_CHECK_INTERVAL``.
+    """
+    if not CLONE_CACHE_DIR.is_dir():
+        return
+
+    now = time.time()
+    entries = []
+    for entry in CLONE_CACHE_DIR.iterdir():
+        if not entry.is_dir() or entry == keep:
+            continue
+        mtime = entry.stat().st_mtime
+        if now - mtime > CLONE_CACHE_TTL:
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entries.append((mtime, entry))
+
+    if not entries:
+        return
+    stamp = CLONE_CACHE_DIR / ".size-checked"
+    if stamp.exists() and now - stamp.stat().st_mtime < CLONE_CACHE_SIZE_CHECK_INTERVAL:
+        return
+    stamp.touch()
+
+    sizes = {entry: _dir_size(entry) for _, entry in entries}
+    total = sum(sizes.values()) + (_dir_size(keep) if keep and keep.is_dir() else 0)
+    for _, entry in sorted(entries):
+        if total <= CLONE_CACHE_MAX_BYTES:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= sizes[entry]
 
 
 class ToolHandlers:
@@ -15,235 +274,539 @@ class ToolHandlers:
         self.console = console
         self.github_repo_url = None
         self.local_repo_path = None
-
-    def set_repository(self, github_repo_url: str) -> Tuple[str, str]:
-        """Set and clone the GitHub repository."""
+        self.git_dir = None
+        # Where generated files (Dockerfiles, IaC templates, reports) are written
+        self.output_dir = None
+        # (method, HEAD sha or repo URL) -> (result, timestamp)
+        self._result_cache: Dict[tuple, Tuple[str, float]] = {}
+        self._cache_lock = threading.Lock()
+        self._git_session: Optional[GitSession] = None
+        self._repo: Optional[Repo] = None
+        self._clone_future: Optional[Future] = None
+        # Set when the bound repository could not be cloned
+        self._clone_error: Optional[str] = None
+        # Repository basename -> cached clone, so forks can borrow its objects
+        self._clone_index: Dict[str, Path] = {}
+
+    def set_repository(self, github_repo_url: str, shallow: bool = True,
+                       background: bool = False) -> Tuple[str, str]:
+        """Set and clone the GitHub repository.
+
+        By default a shallow, blobless clone is made; pass ``shallow=False``
+        for tools that need the full history. With ``background=True`` the
+        clone runs on a worker thread and this returns immediately with empty
+        output; repository tools wait for it on first use and report a
+        failed clone as their result.
+
+        The clone lives under ``CLONE_CACHE_DIR``, which is pruned and reset
+        on refresh, so generated files are written to ``./<repo name>`` in
+        the current directory instead.
+        """
+        # Never let two clones of the same cache entry overlap
+        self._ensure_cloned()
+
+        if github_repo_url != self.github_repo_url:
+            with self._cache_lock:
+                self._result_cache.clear()
         self.github_repo_url = github_repo_url
+        self._clone_error = None
 
-        # Clone the repo if not already present
-        repo_name = github_repo_url.rstrip('/').split('/')[-1]
-        local_repo_path = os.path.join(os.getcwd(), repo_name)
-        clone_output = ""
-
-        if not os.path.exists(local_repo_path):
-            self.console.print(f"[bold cyan]Cloning repository to:[/] [italic blue]{local_repo_path}[/italic blue]")
-            try:
-                result = subprocess.run([
-                    "git", "clone", github_repo_url, local_repo_path
-                ], capture_output=True, text=True, check=True)
-                clone_output = result.stdout + "\n" + result.stderr
-            except subprocess.CalledProcessError as e:
-                clone_output = e.stdout + "\n" + e.stderr
+        # Clones live in a cache directory keyed by the repository URL
+        key = hashlib.sha256(github_repo_url.encode()).hexdigest()
+        local_repo_path = str(CLONE_CACHE_DIR / key)
+        self.local_repo_path = local_repo_path
+        # Git directory of the clone, used to walk trees without touching the checkout
+        self.git_dir = os.path.join(local_repo_path, ".git")
+        # The cache is pruned and reset on refresh, so generated files go to
+        # ./<repo name> where the user can find and keep them
+        self.output_dir = os.path.join(os.getcwd(), _repo_name(github_repo_url))
+
+        if background:
+            self.console.print(f"[bold cyan]Preparing repository in the background:[/] [italic blue]{local_repo_path}[/italic blue]")
+            self._clone_future = _CLONE_EXECUTOR.submit(
+                self._prepare_repository, github_repo_url, local_repo_path, shallow, False
+            )
+            clone_output = ""
         else:
-            self.console.print(f"[bold green]Repository already cloned at:[/] [italic blue]{local_repo_path}[/italic blue]")
+            clone_output = self._prepare_repository(github_repo_url, local_repo_path, shallow, True)
 
-        self.local_repo_path = local_repo_path
         self.console.print(f"[bold cyan]Working with repository:[/] [italic blue]{github_repo_url}[/italic blue]")
 
         return clone_output, local_repo_path
 
+    def _prepare_repository(self, github_repo_url: str, local_repo_path: str, shallow: bool,
+                            show_progress: bool) -> str:
+        """Clone or refresh the cache entry and open handles on it."""
+        repo_name = _repo_name(github_repo_url)
+
+        if not os.path.isdir(os.path.join(local_repo_path, ".git")):
+            shutil.rmtree(local_repo_path, ignore_errors=True)
+            os.makedirs(CLONE_CACHE_DIR, exist_ok=True)
+            if show_progress:
+                self.console.print(f"[bold cyan]Cloning repository to:[/] [italic blue]{local_repo_path}[/italic blue]")
+            # A fork of a repository cloned earlier shares most of its history
+            reference = self._clone_index.get(repo_name)
+            try:
+                clone_output = self._clone(github_repo_url, local_repo_path, shallow=shallow,
+                                           show_progress=show_progress, reference=reference)
+            except (subprocess.CalledProcessError, OSError) as e:
+                output = getattr(e, "output", None) or str(e)
+                self._clone_error = f"Error cloning repository {github_repo_url}:\n{output}"
+                shutil.rmtree(local_repo_path, ignore_errors=True)
+                self._close_handles()
+                return self._clone_error
+        else:
+            if show_progress:
+                self.console.print(f"[bold green]Refreshing cached repository at:[/] [italic blue]{local_repo_path}[/italic blue]")
+            clone_output = self._refresh(local_repo_path, shallow=shallow)
+
+        # Touch the entry so the LRU eviction sees it as recently used
+        if os.path.isdir(local_repo_path):
+            os.utime(local_repo_path)
+            # Only full clones can serve as a reference for later clones
+            if not os.path.exists(os.path.join(local_repo_path, ".git", "shallow")):
+                self._clone_index[repo_name] = Path(local_repo_path)
+        _prune_clone_cache(keep=Path(local_repo_path))
+
+        if self._git_session is None or self._git_session.repo_path != local_repo_path:
+            if self._git_session is not None:
+                self._git_session.close()
+            self._git_session = GitSession(local_repo_path)
+
+        # Open the repository once and share the handle across handlers
+        if self._repo is not None:
+            self._repo.close()
+        try:
+            self._repo = Repo(local_repo_path)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            self._repo = None
+
+        return clone_output
+
+    def _ensure_output_dir(self) -> str:
+        """Create the directory generated files are written to and return it."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        return self.output_dir
+
+    def _ensure_cloned(self, show_progress: bool = False) -> Optional[str]:
+        """Wait for a background clone started by ``set_repository``.
+
+        Args:
+            show_progress: Show a spinner while the clone is still running
+
+        Returns:
+            The error message if the bound repository could not be cloned,
+            otherwise None
+        """
+        future, self._clone_future = self._clone_future, None
+        if future is not None:
+            try:
+                if show_progress and not future.done():
+                    with _new_progress("Waiting for repository clone...", bar=False) as progress:
+                        progress.add_task("Cloning", total=None)
+                        future.result()
+                else:
+                    future.result()
+            except Exception as e:
+                self._clone_error = f"Error preparing repository {self.github_repo_url}: {str(e)}"
+        return self._clone_error
+
+    def close(self) -> None:
+        """Release the git process held for the bound repository."""
+        self._ensure_cloned()
+        self._close_handles()
+
+    def _close_handles(self) -> None:
+        """Close the git process and repository handle without waiting for a clone."""
+        if self._git_session is not None:
+            self._git_session.close()
+            self._git_session = None
+        if self._repo is not None:
+            self._repo.close()
+            self._repo = None
+
+    def __enter__(self) -> "ToolHandlers":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _refresh(self, local_repo_path: str, shallow: bool = True) -> str:
+        """Update a cached clone to the latest remote HEAD.
+
+        A shallow entry stays at depth 1 unless full history was requested,
+        in which case it is unshallowed; a full entry is never made shallow.
+        Submodules are then moved to the commits the new HEAD records.
+        """
+        fetch_cmd = ["git", "-C", local_repo_path, *_GIT_TUNING, "fetch"]
+        if os.path.exists(os.path.join(local_repo_path, ".git", "shallow")):
+            fetch_cmd.append("--depth=1" if shallow else "--unshallow")
+        fetch_cmd += ["origin", "HEAD"]
+
+        out_parts: List[str] = []
+        try:
+            fetch = subprocess.run(
+                fetch_cmd,
+                capture_output=True, text=True, check=True
+            )
+            reset = subprocess.run(
+                ["git", "-C", local_repo_path, "reset", "--hard", "FETCH_HEAD"],
+                capture_output=True, text=True, check=True
+            )
+            out_parts.extend([fetch.stderr, "\n", reset.stdout])
+        except subprocess.CalledProcessError as e:
+            out_parts.extend([e.stdout, "\n", e.stderr])
+            return "".join(out_parts)
+        out_parts.append(self._update_submodules(local_repo_path, shallow))
+        return "".join(out_parts)
+
+    def _update_submodules(self, local_repo_path: str, shallow: bool = True) -> str:
+        """Check out submodules at the commits HEAD records.
+
+        This is best effort: a private or unreachable submodule must not cost
+        the user the superproject, so a failure is only reported in the
+        returned output.
+        """
+        if not os.path.exists(os.path.join(local_repo_path, ".gitmodules")):
+            return ""
+        cmd = ["git", "-C", local_repo_path, *_GIT_TUNING, "submodule", "update",
+               "--init", "--recursive", "--jobs=8"]
+        if shallow:
+            cmd.append("--depth=1")
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return result.stdout + result.stderr
+        except (subprocess.CalledProcessError, OSError) as e:
+            output = getattr(e, "stderr", None) or str(e)
+            return f"\nWarning: could not update submodules:\n{output}"
+
+    def _clone(self, github_repo_url: str, local_repo_path: str, shallow: bool = True,
+               show_progress: bool = True, reference: Optional[Path] = None) -> str:
+        """Run ``git clone``, optionally streaming its progress into a Progress bar.
+
+        Raises ``CalledProcessError`` carrying git's output if the clone fails.
+        Submodules are then checked out on a best-effort basis.
+
+        If ``reference`` points at an existing full clone, objects are borrowed
+        from it and then copied in (``--dissociate``) so only missing objects
+        are fetched over the network.
+        """
+        cmd = ["git", *_GIT_TUNING, "clone", "--progress"]
+        if shallow:
+            cmd += ["--depth=1", "--single-branch", "--filter=blob:none"]
+        if reference is not None:
+            cmd += ["--reference-if-able", str(reference), "--dissociate"]
+        cmd += [github_repo_url, local_repo_path]
+
+        out_parts: List[str] = []
+        progress = _new_progress("Cloning repository...") if show_progress else None
+        with progress or contextlib.nullcontext():
+            task = progress.add_task("Cloning", total=100) if progress else None
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+            # git rewrites progress lines in place with '\r', which the text
+            # mode universal-newline handling turns into separate lines
+            for line in iter(proc.stdout.readline, ""):
+                match = _CLONE_PROGRESS_RE.search(line)
+                if match:
+                    if progress:
+                        progress.update(task, completed=int(match.group(1)))
+                else:
+                    out_parts.append(line)
+            proc.wait()
+            if progress and proc.returncode == 0:
+                progress.update(task, completed=100)
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output="".join(out_parts))
+        # Submodules are fetched separately so one that fails doesn't fail the clone
+        out_parts.append(self._update_submodules(local_repo_path, shallow))
+        return "".join(out_parts)
+
+    def _author_counts(self) -> Dict[str, int]:
+        """Count commits per author email in the bound repository's history.
+
+        A shallow clone only holds the latest commit, so its history is
+        fetched first. The clone is blobless, so this only transfers commits
+        and trees. If the history cannot be fetched no counts are returned
+        rather than misleading ones.
+        """
+        if self._repo is None:
+            return {}
+        try:
+            if os.path.exists(os.path.join(self._repo.git_dir, "shallow")):
+                self._repo.git.execute(
+                    ["git", *_GIT_TUNING, "fetch", "--unshallow", "--quiet", "origin", "HEAD"]
+                )
+            # A single git log prints every author; reading commit.author
+            # through GitPython costs an object lookup per commit
+            emails = self._repo.git.log("--format=%ae", "HEAD")
+        except GitCommandError:
+            return {}
+        return dict(Counter(emails.splitlines()))
+
+    def _head_sha(self) -> Optional[str]:
+        """Return the commit sha checked out in the local clone, if any.
+
+        HEAD is resolved by reading ``.git/HEAD`` and the ref it points at
+        (loose, then ``packed-refs``), which is far cheaper than spawning
+        ``git rev-parse`` on every tool call. Unusual layouts fall back to git.
+        """
+        if not self.local_repo_path:
+            return None
+        git_dir = Path(self.local_repo_path) / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+            if not head.startswith("ref: "):
+                return head  # Detached HEAD
+            ref = head[5:]
+            try:
+                return (git_dir / ref).read_text().strip()
+            except FileNotFoundError:
+                with open(git_dir / "packed-refs") as f:
+                    for line in f:
+                        if line.rstrip("\n").endswith(" " + ref):
+                            return line.split(" ", 1)[0]
+        except OSError:
+            pass
+
+        try:
+            return subprocess.check_output(
+                ["git", "-C", self.local_repo_path, "rev-parse", "HEAD"],
+                stderr=subprocess.DEVNULL, text=True
+            ).strip()
+        except (subprocess.CalledProcessError, OSError):
+            return None
+
+    def _cached(self, method_name: str, compute: Callable[[], str]) -> str:
+        """Return a memoized tool result, calling ``compute`` only on a miss.
+
+        Only tools without side effects may be memoized; a cache hit skips
+        ``compute`` entirely.
+
+        Results are keyed on the repository HEAD so they stay valid until the
+        repository changes. When HEAD cannot be resolved they are keyed on
+        the URL instead and expire after ``RESULT_CACHE_TTL`` seconds.
+        """
+        head = self._head_sha()
+        if head:
+            key, ttl = (method_name, head), None
+        else:
+            key, ttl = (method_name, self.github_repo_url), RESULT_CACHE_TTL
+
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+        if entry is not None:
+            result, stamp = entry
+            if ttl is None or time.time() - stamp < ttl:
+                return result
+
+        result = compute()
+        # Don't memoize failures so the next click retries
+        if result and not result.startswith("Error"):
+            with self._cache_lock:
+                self._result_cache[key] = (result, time.time())
+        return result
+
+    def _batch_preamble(self, names: List[str],
+                        show_progress: bool = False) -> Optional[Dict[str, Tuple[str, str]]]:
+        """Validate a batch and wait for the clone it runs against.
+
+        Returns:
+            The results to return instead of running the batch when there is
+            nothing to run (no repository, failed clone, empty batch), else None
+
+        Raises:
+            ValueError: If a name is not in ``BATCH_TOOLS``
+        """
+        unknown = [name for name in names if name not in BATCH_TOOLS]
+        if unknown:
+            raise ValueError(f"Unknown batch tool(s): {', '.join(unknown)}")
+        if not self.github_repo_url:
+            return {
+                name: ("GitHub repository URL not set. Please restart or set it.", TOOLS[name].error_title)
+                for name in names
+            }
+        if not names:
+            return {}
+        clone_error = self._ensure_cloned(show_progress=show_progress)
+        if clone_error:
+            return {name: (clone_error, TOOLS[name].error_title) for name in names}
+        return None
+
+    def run_all(self, names: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Run several repository tools concurrently.
+
+        Args:
+            names: Tool names from ``BATCH_TOOLS``
+
+        Returns:
+            Mapping of tool name to its ``(result, title)`` pair
+        """
+        early = self._batch_preamble(names, show_progress=True)
+        if early is not None:
+            return early
+
+        results = {}
+        # One line per tool; the spinner turns into a check mark when it finishes
+        with _new_progress(wait=False, bar=False) as progress:
+            tasks = {name: progress.add_task(TOOLS[name].label, total=1) for name in names}
+            # The tools block on subprocesses and HTTP calls, so threads overlap well
+            with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+                futures = {}
+                for name in names:
+                    future = executor.submit(TOOLS[name].batch or TOOLS[name].compute, self)
+                    future.add_done_callback(
+                        lambda _, task=tasks[name]: progress.update(task, completed=1)
+                    )
+                    futures[future] = name
+
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = f"Error running {name}: {str(e)}"
+                    results[name] = (result, TOOLS[name].title)
+
+        return results
+
+    async def run_all_async(self, names: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Asyncio counterpart of ``run_all`` for callers that own an event loop.
+
+        The tools are blocking LLM/HTTP calls, so each one runs on the loop's
+        default executor and the waits overlap under ``asyncio.gather``.
+        """
+        loop = asyncio.get_running_loop()
+        # Waiting for the clone blocks, so it runs off the event loop
+        early = await loop.run_in_executor(None, self._batch_preamble, names)
+        if early is not None:
+            return early
+        with _new_progress(wait=False, bar=False) as progress:
+            async def run_one(name: str) -> Tuple[str, Tuple[str, str]]:
+                task = progress.add_task(TOOLS[name].label, total=1)
+                try:
+                    result = await loop.run_in_executor(None, TOOLS[name].batch or TOOLS[name].compute, self)
+                except Exception as e:
+                    result = f"Error running {name}: {str(e)}"
+                progress.update(task, completed=1)
+                return name, (result, TOOLS[name].title)
+
+            pairs = await asyncio.gather(*(run_one(name) for name in names))
+
+        return dict(pairs)
+
     def analyze_logs(self) -> Tuple[str, str]:
         """Handle log analysis tool."""
         # Get log file path from user
         log_file = self.console.input("[bold green]►[/bold green] [bold cyan]Enter log file path[/bold cyan]")
 
-        # Process the log file
+        try:
+            total = os.path.getsize(log_file)
+        except OSError as e:
+            return f"Error analyzing logs: {str(e)}", "📊 Log Analysis Results"
+
+        # Stream the log file so memory stays bounded and the bar tracks bytes read
         result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Analyzing logs...[/bold cyan]"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]Please wait[/bold cyan]"),
-        ) as progress:
-            task = progress.add_task("Analyzing", total=100)
-            progress.update(task, advance=50)
-            result = self.devops_tools._analyze_logs(log_file)
-            progress.update(task, advance=50)
+        with _new_progress("Analyzing logs...") as progress:
+            task = progress.add_task("Analyzing", total=total)
+
+            def chunks() -> Iterator[bytes]:
+                for chunk in _iter_chunks(log_file):
+                    progress.update(task, advance=len(chunk))
+                    yield chunk
+
+            result = self.devops_tools._analyze_logs_chunks(chunks())
 
         return result, "📊 Log Analysis Results"
 
+    def _dispatch(self, name: str, *args: Any) -> Tuple[str, str]:
+        """Run a tool from ``TOOLS`` and return its ``(result, title)`` pair."""
+        tool = TOOLS[name]
+        if tool.requires_repo and not self.github_repo_url:
+            return "GitHub repository URL not set. Please restart or set it.", tool.error_title
+        # Only tools that read the clone wait for a background clone to finish
+        if tool.requires_repo or (tool.uses_clone and self.github_repo_url):
+            clone_error = self._ensure_cloned(show_progress=True)
+            if clone_error:
+                return clone_error, tool.error_title
+
+        try:
+            if tool.stream is not None:
+                result = tool.stream(self, *args)
+            else:
+                result = _maybe_progress(tool.label, lambda: tool.compute(self, *args))
+        except Exception as e:
+            result = f"Error running {name.replace('_', ' ')}: {str(e)}\nPlease try again."
+        return result, tool.title
+
+    def _render_stream(self, label: str, chunks: Iterator[str]) -> str:
+        """Render streamed text live as Markdown and return the full text.
+
+        A spinner is shown until the first chunk arrives. The Markdown is
+        rebuilt at most ``STREAM_RENDER_INTERVAL`` apart rather than on every
+        chunk, since re-parsing the growing text per token is quadratic.
+        Errors from ``chunks`` propagate, so a partial stream is never
+        returned (or memoized) as a result.
+        """
+        parts: List[str] = []
+        rendered = 0
+        last_render = 0.0
+        with Live(Spinner("dots", text=f"[bold cyan]{label}[/bold cyan]"), console=self.console,
+                  refresh_per_second=10, transient=True) as live:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                parts.append(chunk)
+                now = time.monotonic()
+                if now - last_render >= STREAM_RENDER_INTERVAL:
+                    live.update(Markdown("".join(parts)))
+                    rendered, last_render = len(parts), now
+            if len(parts) != rendered:
+                live.update(Markdown("".join(parts)))
+        return "".join(parts)
+
     def infrastructure(self) -> Tuple[str, str]:
         """Handle infrastructure suggestions tool."""
-        result = ""
-
-        # Check if GitHub repo URL is available
-        if self.github_repo_url:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold cyan]Analyzing repository and generating infrastructure suggestions...[/bold cyan]"),
-                BarColumn(bar_width=40),
-                TextColumn("[bold cyan]Please wait[/bold cyan]"),
-            ) as progress:
-                task = progress.add_task("Infrastructure Analysis", total=100)
-                progress.update(task, advance=50)
-                try:
-                    # Use local repo path for deeper analysis and generate IAC
-                    result = self.devops_tools._infra_suggest(
-                        context="",
-                        repo_path=self.local_repo_path,
-                        generate_iac=True
-                    )
-                except Exception as e:
-                    result = f"Error generating infrastructure suggestions: {str(e)}\nPlease try again or provide more specific context."
-                progress.update(task, advance=50)
-        else:
+        context = ""
+        if not self.github_repo_url:
             # No GitHub repo set, ask for manual context input
             context = self.console.input("[bold green]►[/bold green] [bold cyan]Enter infrastructure context[/bold cyan]")
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold cyan]Generating infrastructure suggestions...[/bold cyan]"),
-                BarColumn(bar_width=40),
-            ) as progress:
-                task = progress.add_task("Generating", total=100)
-                progress.update(task, advance=50)
-                try:
-                    result = self.devops_tools._infra_suggest(
-                        context=context,
-                        generate_iac=True
-                    )
-                except Exception as e:
-                    result = f"Error generating infrastructure suggestions: {str(e)}\nPlease try again or provide more specific context."
-                progress.update(task, advance=50)
+
+        result, title = self._dispatch("infrastructure", context)
 
         # Ensure we always return a non-empty result
         if not result or result.strip() == "":
             result = "No infrastructure suggestions could be generated. Please try again with a different repository or more specific context."
 
-        return result, "🏗️ Infrastructure Recommendations"
+        return result, title
 
     def security_scan(self) -> Tuple[str, str]:
         """Handle security scan tool."""
-        # Get target from user
         target = self.console.input("[bold green]►[/bold green] [bold cyan]Enter target to scan[/bold cyan]")
-
-        # Process the security scan
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Scanning for security issues...[/bold cyan]"),
-            BarColumn(bar_width=40),
-        ) as progress:
-            task = progress.add_task("Scanning", total=100)
-            progress.update(task, advance=50)
-            result = self.devops_tools._security_scan(target)
-            progress.update(task, advance=50)
-
-        return result, "🔒 Security Scan Results"
+        return self._dispatch("security_scan", target)
 
     def optimize(self) -> Tuple[str, str]:
         """Handle optimization tool."""
-        # Get context from user
         context = self.console.input("[bold green]►[/bold green] [bold cyan]Enter optimization context[/bold cyan]")
-
-        # Process the optimization
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Generating optimization recommendations...[/bold cyan]"),
-            BarColumn(bar_width=40),
-        ) as progress:
-            task = progress.add_task("Optimizing", total=100)
-            progress.update(task, advance=50)
-            result = self.devops_tools._optimize(context)
-            progress.update(task, advance=50)
-
-        return result, "⚡ Optimization Recommendations"
+        return self._dispatch("optimize", context)
 
     def git_ingest(self) -> Tuple[str, str]:
         """Handle git ingest tool."""
-        if not self.github_repo_url:
-            return "GitHub repository URL not set. Please restart or set it.", "⚙️ Git Ingest Error"
-
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Ingesting repository...[/bold cyan]"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]Please wait[/bold cyan]"),
-        ) as progress:
-            task = progress.add_task("Ingesting", total=100)
-            progress.update(task, advance=50)
-            try:
-                result = self.devops_tools._git_ingest(self.github_repo_url)
-            except AttributeError:
-                result = f"Git ingest functionality for '{self.github_repo_url}' is under development."
-            progress.update(task, advance=50)
-
-        return result, "⚙️ Git Ingest Results"
+        return self._dispatch("git_ingest")
 
     def code_quality(self) -> Tuple[str, str]:
         """Handle code quality tool."""
-        if not self.github_repo_url:
-            return "GitHub repository URL not set. Please restart or set it.", "🧑‍💻 Code Quality Error"
-
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Analyzing code quality...[/bold cyan]"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]Please wait[/bold cyan]"),
-        ) as progress:
-            task = progress.add_task("CodeQuality", total=100)
-            progress.update(task, advance=50)
-            result = self.devops_tools._code_quality(self.github_repo_url)
-            progress.update(task, advance=50)
-
-        return result, "🧑‍💻 Code Quality Analysis"
+        return self._dispatch("code_quality")
 
     def dependency_check(self) -> Tuple[str, str]:
         """Handle dependency check tool."""
-        if not self.github_repo_url:
-            return "GitHub repository URL not set. Please restart or set it.", "📦 Dependency Check Error"
-
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Checking dependencies...[/bold cyan]"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]Please wait[/bold cyan]"),
-        ) as progress:
-            task = progress.add_task("DependencyCheck", total=100)
-            progress.update(task, advance=50)
-            result = self.devops_tools._dependency_check(self.github_repo_url)
-            progress.update(task, advance=50)
-
-        return result, "📦 Dependency Check Results"
+        return self._dispatch("dependency_check")
 
     def contributors(self) -> Tuple[str, str]:
         """Handle contributors tool."""
-        if not self.github_repo_url:
-            return "GitHub repository URL not set. Please restart or set it.", "👥 Contributors Error"
-
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Fetching contributor statistics...[/bold cyan]"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]Please wait[/bold cyan]"),
-        ) as progress:
-            task = progress.add_task("Contributors", total=100)
-            progress.update(task, advance=50)
-            result = self.devops_tools._contributors(self.github_repo_url)
-            progress.update(task, advance=50)
-
-        return result, "👥 Contributor Statistics"
+        return self._dispatch("contributors")
 
     def docker_generation(self) -> Tuple[str, str]:
         """Handle docker generation tool."""
-        if not self.github_repo_url:
-            return "GitHub repository URL not set. Please restart or set it.", "🐳 Docker Generation Error"
-
-        result = ""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Analyzing repository and generating Docker files...[/bold cyan]"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]Please wait[/bold cyan]"),
-        ) as progress:
-            task = progress.add_task("DockerGeneration", total=100)
-            progress.update(task, advance=50)
-            # Use the local repo path for Docker generation
-            result = self.devops_tools._docker_generation(self.local_repo_path)
-            progress.update(task, advance=50)
-
-        return result, "🐳 Docker Generation Results"
\ No newline at end of file
+        return self._dispatch("docker_generation")